@@ -5,31 +5,136 @@ versioning and logging.
 Contains utilities for version management and package deployment.
 """
 
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
+from json import dumps, loads
 from os import getenv
 from pathlib import Path
+from re import MULTILINE, escape, sub
 from subprocess import CalledProcessError, run
 from sys import exit
 from textwrap import dedent
-from typing import Optional
+from time import time
+from tomllib import TOMLDecodeError, load
+from typing import Any, Dict, Optional
 
-from replit import info
-from requests import get
+VERSION_CACHE_PATH = Path.home() / ".cache" / "pypi_upload" / "versions.json"
+VERSION_CACHE_TTL = 300
 
 
-def get_latest_version(project_name) -> str:
-    """Fetch the latest version from PyPI.
+def read_cached_version(project_name: str) -> Optional[str]:
+    """Read a recent version of a project from the on-disk cache.
+
+    Args:
+        project_name: Project name
 
     Returns:
-        str: Latest version number in format 'x.y.z' or
-             '0.0.0' if not found
+        Optional[str]: Cached version or None if missing or stale
+    """
+    with suppress(Exception):
+        entry = loads(VERSION_CACHE_PATH.read_text())[project_name]
+        if time() - entry["time"] < VERSION_CACHE_TTL:
+            return entry["version"]
+    return None
+
+
+def write_cached_version(project_name: str, version: str) -> None:
+    """Record the version of a project in the on-disk cache.
+
+    Args:
+        project_name: Project name
+        version: Version number to record
+    """
+    cache = {}
+    with suppress(Exception):
+        cache = loads(VERSION_CACHE_PATH.read_text())
+    cache[project_name] = {"version": version, "time": time()}
+    with suppress(OSError):
+        VERSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        VERSION_CACHE_PATH.write_text(dumps(cache))
+
+
+def read_local_version(pyproject_path: str) -> Optional[str]:
+    """Read the project version recorded in pyproject.toml.
+
+    Args:
+        pyproject_path: Path to pyproject.toml
+
+    Returns:
+        Optional[str]: Recorded version or None if there is none
+    """
+    with (
+        suppress(OSError, KeyError, TOMLDecodeError),
+        open(pyproject_path, "rb") as f,
+    ):
+        return load(f)["project"]["version"]
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_session() -> Any:
+    """Get the HTTP session shared by all PyPI calls.
+
+    requests is imported on first use, so runs served from the version
+    cache never load it.
+
+    Returns:
+        Shared requests session
+    """
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+            ),
+        ),
+    )
+    return session
+
+
+@lru_cache(maxsize=128)
+def fetch_latest_version(project_name: str) -> str:
+    """Fetch the latest version from PyPI, remembering successful lookups.
+
+    Returns:
+        str: Latest version number in format 'x.y.z'
+
+    Raises:
+        Exception: If PyPI cannot be reached or has no such project
     """
+    cached_version = read_cached_version(project_name)
+    if cached_version:
+        return cached_version
     print(f"Fetching latest version for {project_name}...")
     print(f"Url: https://pypi.org/pypi/{project_name}/json")
+    version = (
+        get_session()
+        .get(f"https://pypi.org/pypi/{project_name}/json", timeout=5)
+        .json()["info"]["version"]
+    )
+    write_cached_version(project_name, version)
+    return version
+
+
+def get_latest_version(project_name: str) -> str:
+    """Fetch the latest version from PyPI.
+
+    Failed lookups are not cached, so a later call tries PyPI again.
+
+    Returns:
+        str: Latest version number in format 'x.y.z' or
+             '0.1.13' if not found
+    """
     try:
-        return get(f"https://pypi.org/pypi/{project_name}/json").json()[
-            "info"
-        ]["version"]
+        return fetch_latest_version(project_name)
     except Exception:
         return "0.1.13"
 
@@ -49,50 +154,67 @@ def increment_version(version: str) -> str:
 
 def update_version_in_files(
     new_version: str, pyproject_path: str, project_name: str
-) -> None:
+) -> Dict[Path, str]:
     """Update version strings in project configuration files.
 
     Args:
         new_version: Version string to set
+
+    Returns:
+        Dict[Path, str]: Original contents of the updated files
     """
+    current_version = read_local_version(pyproject_path) or get_latest_version(
+        project_name
+    )
+    pyproject = Path(pyproject_path)
+    setup = Path("setup.py")
+    package_init = Path("src/tree_interval/__init__.py")
+    originals = {
+        path: path.read_text(encoding="utf-8")
+        for path in (pyproject, setup, package_init)
+    }
+
     # Update pyproject.toml
-    with open(pyproject_path, "r") as f:
-        content = f.read()
-    with open(pyproject_path, "w") as f:
-        f.write(
-            content.replace(
-                f'version = "{get_latest_version(project_name)}"',
-                f'version = "{new_version}"',
-            )
-        )
+    pyproject.write_text(
+        sub(
+            rf'version = "{escape(current_version)}"',
+            f'version = "{new_version}"',
+            originals[pyproject],
+        ),
+        encoding="utf-8",
+    )
 
     # Update setup.py
-    with open("setup.py", "r") as f:
-        content = f.read()
-    with open("setup.py", "w") as f:
-        f.write(
-            content.replace(
-                f'version="{get_latest_version(project_name)}"',
-                f'version="{new_version}"',
-            )
-        )
+    setup.write_text(
+        sub(
+            rf'version="{escape(current_version)}"',
+            f'version="{new_version}"',
+            originals[setup],
+        ),
+        encoding="utf-8",
+    )
+
+    # Update package __init__.py
+    package_init.write_text(
+        sub(
+            r"^(.*__version__ = ).*$",
+            rf'\g<1>"{new_version}"',
+            originals[package_init],
+            flags=MULTILINE,
+        ),
+        encoding="utf-8",
+    )
+    return originals
+
+
+def restore_files(originals: Dict[Path, str]) -> None:
+    """Write back the contents of files changed by a failed release.
 
-    with open("src/tree_interval/__init__.py", "r") as f:
-        content = f.read()
-    with open("src/tree_interval/__init__.py", "w") as f:
-        match_string = "__version__ = "
-        f.write(
-            "\n".join(
-                (
-                    line.split(match_string, 1)[0]
-                    + match_string
-                    + f'"{new_version}"\n'
-                    if match_string in line
-                    else line
-                )
-                for line in content.splitlines()
-            )
-        )
+    Args:
+        originals: Original contents of each changed file
+    """
+    for path, text in originals.items():
+        path.write_text(text, encoding="utf-8")
 
 
 def check_token() -> str:
@@ -174,28 +296,42 @@ def build_and_upload(project_dir: Optional[str] = None) -> None:
 
 def main() -> None:
     """Main execution function for PyPI package upload."""
+    from replit import info
+
     print(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-    project_name = get(str(info.replit_id_url)).url.split("/")[-1]
+    replit_url = get_session().get(str(info.replit_id_url), timeout=5).url
+    project_name = replit_url.split("/")[-1]
     print(str(info.replit_id_url))
-    print(get(str(info.replit_id_url)).url)
+    print(replit_url)
     pyproject_path = "pyproject.toml"
 
     # Install required packages
     run(["pip", "install", "wheel", "twine", "build"], check=True)
 
+    # Check and setup PyPI token before touching any file
+    create_pypirc(check_token())
+
     # Get current version and increment it
-    current_version = get_latest_version(project_name)
+    current_version = read_local_version(pyproject_path) or get_latest_version(
+        project_name
+    )
     new_version = increment_version(current_version)
     print(f"Incrementing version from {current_version} to {new_version}")
 
     # Update version in files
-    update_version_in_files(new_version, pyproject_path, project_name)
-
-    # Check and setup PyPI token
-    create_pypirc(check_token())
+    originals = update_version_in_files(
+        new_version, pyproject_path, project_name
+    )
 
-    # Build and upload directly
-    build_and_upload(f'{Path.home()}/{(info.replit_url or "").split("/")[-1]}')
+    # Build and upload directly, putting the files back if that fails
+    try:
+        build_and_upload(
+            f'{Path.home()}/{(info.replit_url or "").split("/")[-1]}'
+        )
+    except SystemExit:
+        restore_files(originals)
+        raise
+    write_cached_version(project_name, new_version)
     print("Package built and uploaded successfully!")
 
 
@@ -0,0 +1,111 @@
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parent.parent
+    / "scripts"
+    / "prepare_environment.py"
+)
+
+
+@pytest.fixture(scope="module")
+def prepare_environment():
+    spec = spec_from_file_location("prepare_environment", SCRIPT_PATH)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def is_installed(prepare_environment):
+    prepare_environment.is_installed.cache_clear()
+    yield prepare_environment.is_installed
+    prepare_environment.is_installed.cache_clear()
+
+
+def test_is_installed(is_installed):
+    assert is_installed("pytest")
+    assert is_installed(f"pytest=={pytest.__version__}")
+    assert is_installed("pytest>=1.0")
+    assert not is_installed("pytest==0.0.1")
+    assert not is_installed("no-such-package-x")
+
+
+def test_is_installed_imported_module(
+    prepare_environment, is_installed, monkeypatch
+):
+    monkeypatch.setattr(
+        prepare_environment, "version", lambda _: pytest.fail("lookup")
+    )
+    assert is_installed("pytest")
+
+
+def test_is_installed_marker(is_installed):
+    pytest.importorskip("packaging")
+    assert is_installed('no-such-package-x; python_version < "3"')
+    assert not is_installed('pytest==0.0.1; python_version >= "3"')
+
+
+@pytest.mark.usefixtures("is_installed")
+def test_check_packages_reports_mismatched_pin(prepare_environment, capsys):
+    missing = prepare_environment.check_packages(["pytest", "pytest==0.0.1"])
+    assert missing == ("pytest==0.0.1",)
+    assert "✗ pytest==0.0.1 is not installed" in capsys.readouterr().out
+
+
+def test_render_template(prepare_environment):
+    rendered = prepare_environment.render_template(
+        "@@name@@ by @@author@@ (@@missing@@)",
+        {"name": "tree-interval", "author": "Jane Doe"},
+    )
+    assert rendered == "tree-interval by Jane Doe (@@missing@@)"
+
+
+def test_render_template_single_pass(prepare_environment):
+    rendered = prepare_environment.render_template(
+        "@@first@@", {"first": "@@second@@", "second": "value"}
+    )
+    assert rendered == "@@second@@"
+
+
+@pytest.mark.parametrize(
+    ("topic", "classifier"),
+    [
+        (
+            "Python Modules",
+            "Topic :: Software Development :: Libraries :: Python Modules",
+        ),
+        ("Debuggers", "Topic :: Software Development :: Debuggers"),
+        (
+            "code generators",
+            "Topic :: Software Development :: Code Generators",
+        ),
+        (
+            "PicoGUI :: Themes",
+            "Topic :: Desktop Environment :: PicoGUI :: Themes",
+        ),
+        (
+            "Topic :: Software Development :: Debuggers",
+            "Topic :: Software Development :: Debuggers",
+        ),
+    ],
+)
+def test_match_classifier_suffix(prepare_environment, topic, classifier):
+    assert prepare_environment.match_classifier(topic) == classifier
+
+
+def test_match_classifier_ambiguous_suffix(prepare_environment):
+    # "Themes" ends several classifiers, so it is left to difflib
+    assert "themes" not in prepare_environment.get_topic_index()
+    assert prepare_environment.match_classifier("Themes") == (
+        "Topic :: Terminals"
+    )
+
+
+def test_normalize_topic(prepare_environment):
+    assert (
+        prepare_environment.normalize_topic("Libraries::Python Modules")
+        == "libraries :: python modules"
+    )
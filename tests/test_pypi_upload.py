@@ -0,0 +1,131 @@
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).resolve().parent.parent / "scripts" / "pypi_upload.py"
+)
+
+
+@pytest.fixture
+def pypi_upload():
+    spec = spec_from_file_location("pypi_upload", SCRIPT_PATH)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = {
+        "pyproject.toml": '[project]\nname = "demo"\nversion = "0.1.26"\n',
+        "setup.py": 'setup(name="demo", version="0.1.26")\n',
+        "src/tree_interval/__init__.py": '__version__ = "0.1.26"\n',
+    }
+    for name, text in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path, files
+
+
+@pytest.fixture
+def replit(pypi_upload, monkeypatch):
+    info = SimpleNamespace(replit_id_url="id", replit_url="demo")
+    monkeypatch.setitem(sys.modules, "replit", SimpleNamespace(info=info))
+    session = SimpleNamespace(
+        get=lambda *_, **__: SimpleNamespace(url="https://replit.com/demo")
+    )
+    monkeypatch.setattr(pypi_upload, "get_session", lambda: session)
+    monkeypatch.setattr(pypi_upload, "run", lambda *_, **__: None)
+    return info
+
+
+def test_update_version_in_files(pypi_upload, project, monkeypatch):
+    root, files = project
+    monkeypatch.setattr(
+        pypi_upload, "get_latest_version", lambda _: pytest.fail("network")
+    )
+    originals = pypi_upload.update_version_in_files(
+        "0.1.27", "pyproject.toml", "demo"
+    )
+    assert {path.as_posix(): text for path, text in originals.items()} == (
+        files
+    )
+    assert 'version = "0.1.27"' in (root / "pyproject.toml").read_text()
+    assert 'version="0.1.27"' in (root / "setup.py").read_text()
+    assert (
+        root / "src/tree_interval/__init__.py"
+    ).read_text() == '__version__ = "0.1.27"\n'
+
+
+def test_restore_files(pypi_upload, project):
+    root, files = project
+    originals = pypi_upload.update_version_in_files(
+        "0.1.27", "pyproject.toml", "demo"
+    )
+    pypi_upload.restore_files(originals)
+    for name, text in files.items():
+        assert (root / name).read_text() == text
+
+
+@pytest.mark.usefixtures("replit")
+def test_main_restores_files_on_failed_build(
+    pypi_upload, project, monkeypatch
+):
+    root, files = project
+    monkeypatch.setattr(pypi_upload, "check_token", lambda: "token")
+    monkeypatch.setattr(pypi_upload, "create_pypirc", lambda _: None)
+
+    def build_and_upload(_):
+        assert "0.1.27" in (root / "pyproject.toml").read_text()
+        raise SystemExit(1)
+
+    monkeypatch.setattr(pypi_upload, "build_and_upload", build_and_upload)
+    with pytest.raises(SystemExit):
+        pypi_upload.main()
+    for name, text in files.items():
+        assert (root / name).read_text() == text
+
+
+@pytest.mark.usefixtures("replit")
+def test_main_checks_token_before_touching_files(
+    pypi_upload, project, monkeypatch
+):
+    root, files = project
+    monkeypatch.delenv("PYPI_TOKEN", raising=False)
+    with pytest.raises(SystemExit):
+        pypi_upload.main()
+    for name, text in files.items():
+        assert (root / name).read_text() == text
+
+
+def test_get_latest_version_retries_after_failure(
+    pypi_upload, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        pypi_upload, "VERSION_CACHE_PATH", tmp_path / "versions.json"
+    )
+    responses = iter(
+        [
+            ConnectionError("offline"),
+            {"info": {"version": "0.1.26"}},
+        ]
+    )
+
+    def get(*_, **__):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return SimpleNamespace(json=lambda: response)
+
+    monkeypatch.setattr(
+        pypi_upload, "get_session", lambda: SimpleNamespace(get=get)
+    )
+    assert pypi_upload.get_latest_version("demo") == "0.1.13"
+    assert pypi_upload.get_latest_version("demo") == "0.1.26"
+    assert pypi_upload.get_latest_version("demo") == "0.1.26"